@@ -1,32 +1,45 @@
 import bisect
+import itertools
 import random
 import math
 from functools import lru_cache
+import numpy as np
 from random_variables import *
+from random_variables import _NP_RNG, _RNG_INST, _rand, _getrandbits
 
-def random_permutation(n):
+# NumPy generator used by default for the vectorized algorithms below. It is shared with
+# `random_variables`, so that `set_seed` also makes these algorithms reproducible.
+_RNG = _NP_RNG
+
+def random_permutation(n, rng=None):
     """
     Generates a random permutation of the integers from 0 to n-1.
+    The Fisher-Yates shuffle is performed by NumPy.
 
     Parameters:
     -----------
     n : int
         The size of the permutation.
+    rng : numpy.random.Generator, optional
+        The generator to draw from, e.g. a seeded one for reproducible results. Defaults to a module-level generator.
 
     Returns:
     --------
     tuple of int
         A tuple representing the randomly generated permutation.
     """
-    perm = list(range(n))
-    for i in range(n):
-        j = uniform_int(i, n - 1)
-        perm[i], perm[j] = perm[j], perm[i]
-    return tuple(perm)
+    if rng is None:
+        rng = _RNG
+    return tuple(rng.permutation(n).tolist())
 
-def random_subset(n, k):
+def random_subset(n, k, rng=None):
     """
-    Generates a random subset of size k from the set {0, 1, ..., n-1}.
+    Generates a random subset of size k from the set {0, 1, ..., n-1}. The elements appear in random order.
+
+    For k < 12 (and no `rng` given) the first k steps of the Fisher-Yates shuffle are performed in Python,
+    storing only the swapped positions in a dictionary, so the runtime is O(k) independent of n.
+    Otherwise the elements are drawn by NumPy: with `choice` if k < n/2, else as the first k entries
+    of a random permutation.
 
     Parameters:
     -----------
@@ -34,22 +47,34 @@ def random_subset(n, k):
         The size of the full set.
     k : int
         The size of the subset.
+    rng : numpy.random.Generator, optional
+        The generator to draw from, e.g. a seeded one for reproducible results. Defaults to a module-level generator.
 
     Returns:
     --------
     tuple of int
         A tuple representing the randomly generated subset.
     """
-    perm = list(range(n))
-    # Perform the Fisher-Yates shuffle, but only for the first k elements
-    for i in range(k):
-        j = uniform_int(i, n - 1)
-        perm[i], perm[j] = perm[j], perm[i]
-    return tuple(perm[:k])
-
-def random_partition_with_parts(n, k):
+    if rng is None:
+        if k < 12:
+            # Partial Fisher-Yates shuffle; swapped[i] is the element at position i if it was moved.
+            swapped = {}
+            subset = []
+            for i in range(k):
+                j = i + math.floor(_rand() * (n - i))
+                subset.append(swapped.get(j, j))
+                swapped[j] = swapped.get(i, i)
+            return tuple(subset)
+        rng = _RNG
+
+    if k < n // 2:
+        return tuple(rng.choice(n, size=k, replace=False).tolist())
+    return tuple(rng.permutation(n)[:k].tolist())
+
+def random_partition_with_parts(n, k, rng=None):
     """
     Generates a random partition of the integer n into k parts.
+    For k >= 64, or if `rng` is given, the cuts are drawn and sorted by NumPy; for smaller k in Python.
 
     Parameters:
     -----------
@@ -57,6 +82,8 @@ def random_partition_with_parts(n, k):
         The integer to partition.
     k : int
         The number of parts in the partition.
+    rng : numpy.random.Generator, optional
+        The generator to draw from, e.g. a seeded one for reproducible results. Defaults to a module-level generator.
 
     Returns:
     --------
@@ -66,18 +93,29 @@ def random_partition_with_parts(n, k):
     if k == 1:
         return (n,)
 
+    if rng is None:
+        if k < 64:
+            # Generate k-1 numbers in the range [0, n-k] and sort them
+            cuts = sorted([math.floor(_rand() * (n - k + 1)) for _ in range(k - 1)])
+
+            # Calculate the partition by taking differences of cuts
+            parts = [cuts[0] + 1] + [cuts[i] - cuts[i-1] + 1 for i in range(1, k - 1)] + [n - k - cuts[-1] + 1]
+            return tuple(parts)
+        rng = _RNG
+
     # Generate k-1 numbers in the range [0, n-k] and sort them
-    cuts = sorted([uniform_int(0, n-k) for _ in range(k-1)])
+    cuts = np.sort(rng.integers(0, n - k, size=k - 1, endpoint=True))
     
-    # Calculate the partition by taking differences of cuts
-    parts = [cuts[0] + 1] + [cuts[i] - cuts[i-1] + 1 for i in range(1, k - 1)] + [n - k - cuts[-1] + 1]
+    # Calculate the partition by taking differences of cuts, padded with the bounds 0 and n-k
+    parts = np.diff(np.concatenate(([0], cuts, [n - k]))) + 1
 
-    return tuple(parts)
+    return tuple(parts.tolist())
 
-def sample(lst, weights=None):
+def sample(lst, weights=None, cum_weights=None):
     """
     Samples an element from a list with given probabilities.
     Runtime: O(n) (computing cumulative weights) + O(log(n)) (bisect)
+    If the cumulative weights are precomputed, the runtime is O(log(n)).
     
 
     Parameters:
@@ -85,38 +123,82 @@ def sample(lst, weights=None):
     lst : list or int
         The list from which to sample. If an int is provided, the list will be generated as range(lst).
     weights : list of float, optional
-        A list of probabilities corresponding to the elements of lst.
+        A list of relative weights corresponding to the elements of lst. Defaults to uniform weights.
+    cum_weights : list of float, optional
+        The cumulative weights, e.g. computed once with `itertools.accumulate(weights)` and reused.
+        Takes precedence over `weights`.
 
     Returns:
     --------
     element from lst
         A randomly sampled element from the list based on the provided weights.
-
-    TODO:Preprocess the cumulative probabilities.
     """
     if isinstance(lst, int):
-        lst = list(range(lst))
-    if weights is None:
-        weights = [1 / len(lst) for _ in range(len(lst))]
-    
-    # Compute cumulative probabilities
-    cum_sum = 0
-    probabilities = []
-    for prob in weights:
-        cum_sum += prob
-        probabilities.append(cum_sum)
+        lst = range(lst)
+    if cum_weights is None:
+        if weights is None:
+            return lst[math.floor(_rand() * len(lst))]
+        cum_weights = list(itertools.accumulate(weights))
     
-    assert abs(cum_sum - 1) < 1e-6, "Probabilities must sum to 1"
-    
-    # Sample an element
-    index = bisect.bisect_left(probabilities, uniform(0, 1))
+    # Sample an element. Elements with zero weight are never selected, and `hi` guards against rounding.
+    index = bisect.bisect_right(cum_weights, _rand() * cum_weights[-1], 0, len(cum_weights) - 1)
     return lst[index]
 
-@lru_cache(maxsize=None)
+def sample_many(lst, cum_weights, k):
+    """
+    Samples k elements with replacement from a list with given cumulative weights.
+    Runtime: O(k log(n))
+
+    Parameters:
+    -----------
+    lst : list or int
+        The list from which to sample. If an int is provided, the list will be generated as range(lst).
+    cum_weights : list of float
+        The cumulative weights corresponding to the elements of lst.
+    k : int
+        The number of samples.
+
+    Returns:
+    --------
+    list
+        A list of k randomly sampled elements from lst.
+    """
+    if isinstance(lst, int):
+        lst = range(lst)
+    return _RNG_INST.choices(lst, cum_weights=cum_weights, k=k)
+
+# Table of partition numbers, see `_partition_table`. Grown on demand.
+_PARTITION_TABLE = np.ones((1, 1), dtype=object)
+
+def _partition_table(n):
+    """
+    Returns a table P with at least n+1 rows and columns, where P[i, m] is the number of partitions
+    of i with parts at most m.
+
+    The table is filled row by row using P[i, m] = P[i, m-1] + P[i-m, m], i.e. each row is a cumulative
+    sum, which NumPy computes in one pass. The entries are Python ints, so there is no overflow.
+    Runtime is O(n^2) whenever the table has to grow, O(1) otherwise.
+    """
+    global _PARTITION_TABLE
+    if len(_PARTITION_TABLE) > n:
+        return _PARTITION_TABLE
+
+    size = max(n, 2 * (len(_PARTITION_TABLE) - 1))
+    P = np.zeros((size + 1, size + 1), dtype=object)
+    P[0, :] = 1
+    for i in range(1, size + 1):
+        parts = np.arange(1, i + 1)
+        contributions = np.zeros(size + 1, dtype=object)
+        contributions[1:i + 1] = P[i - parts, parts]
+        P[i, :] = np.cumsum(contributions)
+
+    _PARTITION_TABLE = P
+    return P
+
 def number_partitions(n, max_part=None):
     """
     Calculates the number of partitions of `n` with the largest part at most `max_part`.
-    Dynamic programming algorithm with memoization, runtime is O(n * max_part).
+    The numbers are looked up in a precomputed table, building the table takes O(n^2) once.
 
     Parameters:
     -----------
@@ -134,11 +216,31 @@ def number_partitions(n, max_part=None):
         return 1  # Base case: only one way to partition 0.
     if n < 0 or max_part == 0:
         return 0  # No valid partitions if `n` is negative or `max_part` is zero.
-    if max_part is None:
-        max_part = n  # Default max part to `n` if not specified.
+    if max_part is None or max_part > n:
+        max_part = n  # Parts can not exceed `n`.
 
-    # Recursively calculate the number of partitions. 
-    return number_partitions(n, max_part - 1) + number_partitions(n - max_part, max_part)
+    return _partition_table(n)[n, max_part]
+
+@lru_cache(maxsize=None)
+def _partition_cum(n, max_part):
+    """
+    Computes the cumulative probabilities of the first part of a random partition of `n` with parts at most `max_part`.
+    The probability that the first part is i is number_partitions(n - i, i) / number_partitions(n, max_part).
+
+    Returns:
+    --------
+    tuple of float
+        The cumulative probabilities for the first parts 1, ..., max_part. The last entry is exactly 1.
+    """
+    weights = [number_partitions(n - i, i) for i in range(1, max_part + 1)]
+    total_weight = sum(weights)
+
+    cum = []
+    acc = 0
+    for weight in weights:
+        acc += weight
+        cum.append(acc / total_weight)
+    return tuple(cum)
 
 def random_partition(n, max_part=None):
     """
@@ -146,8 +248,8 @@ def random_partition(n, max_part=None):
 
     A partition is a way of writing `n` as a sum of positive integers. The order of summands does not matter.
     
-    Preprocessing step: `number_partitions(n, max_part)` is used to calculate the number of partitions and has runtime O(n * max_part).
-    The results are cached and subsequent calls have O(n) runtime.
+    Preprocessing step: `number_partitions(n, max_part)` is used to calculate the number of partitions, building its table has runtime O(n^2).
+    The results and the cumulative probabilities of the first part are cached and subsequent calls have O(n) runtime.
 
     Parameters:
     -----------
@@ -167,13 +269,8 @@ def random_partition(n, max_part=None):
     if max_part is None or max_part > n:
         max_part = n  # Default max part to `n` if not specified or exceeds `n`.
 
-    # Calculate the weights for sampling based on the number of partitions.
-    weights = [number_partitions(n - i, i) for i in range(1, max_part + 1)]
-    total_weight = sum(weights)
-    weights = [weight / total_weight for weight in weights]
-
-    # Randomly select the first part of the partition using the calculated weights.
-    first_part = sample(range(1, max_part + 1), weights)
+    # Randomly select the first part of the partition using the cached cumulative probabilities.
+    first_part = sample(range(1, max_part + 1), cum_weights=_partition_cum(n, max_part))
 
     # Recursively generate the remaining partition and return the result as a tuple.
     return (first_part,) + random_partition(n - first_part, first_part)
@@ -205,21 +302,23 @@ def random_ordered_partition(n):
     if n == 1:
         return (1,)
     
-    # Generate n-1 random positions (0 or 1) to determine where to split the partitions.
-    positions = [uniform_int(0, 1) for _ in range(n - 1)]
-    
     partition = []  # List to store the parts of the partition.
     part = 1  # Start with the first part.
     
-    # Iterate over the random positions to form the partition.
-    for pos in positions:
-        if pos == 0:
-            # Continue adding to the current part.
-            part += 1
-        else:
-            # End the current part and start a new one.
-            partition.append(part)
-            part = 1
+    # Each of the n-1 gaps between consecutive units is a split with probability 1/2.
+    # The decisions are drawn as random bits, in chunks of 64 to keep the shifts cheap.
+    for start in range(0, n - 1, 64):
+        width = min(64, n - 1 - start)
+        bits = _getrandbits(width)
+        for _ in range(width):
+            if bits & 1:
+                # End the current part and start a new one.
+                partition.append(part)
+                part = 1
+            else:
+                # Continue adding to the current part.
+                part += 1
+            bits >>= 1
     
     # Append the last part to the partition.
     partition.append(part)
@@ -227,6 +326,9 @@ def random_ordered_partition(n):
     # Return the partition as a tuple.
     return tuple(partition)
 
+# Rows of Young tableaux for parts up to 64, built once and reused.
+_TABLEAU_ROWS = tuple('■ ' * part for part in range(65))
+
 def young_tableau(partition, sort=False):
     """
     Converts a partition into a Young tableau.
@@ -248,11 +350,7 @@ def young_tableau(partition, sort=False):
     if sort:
         partition = tuple(sorted(partition, reverse=True))
     
-    tableau = []
-    
-    for part in partition:
-        row = '■ ' * part
-        tableau.append(row)
+    tableau = [_TABLEAU_ROWS[part] if part < len(_TABLEAU_ROWS) else '■ ' * part for part in partition]
     
     return '\n'.join(tableau)
 
@@ -272,12 +370,14 @@ def random_young_tableau(n):
     """
     return young_tableau(random_partition(n))
 
-@lru_cache(maxsize=None)
+# The Catalan numbers C_0, C_1, ... computed so far. Extended on demand.
+_CATALAN = [1]
+
 def number_dyck_words(n):
     """
     Calculates the number of Dyck words of length 2n.
     The number of Dyck words are the Catalan numbers.
-    Runtime: O(min(k,n-k)) using binomial coefficient from math.comb
+    Runtime: O(1) lookup in a cached list, extending the list up to n takes O(n).
 
     A Dyck word is a balanced string of X's and Y's such that in any prefix of the word, the number of X's is at least the number of Y's.
 
@@ -291,45 +391,127 @@ def number_dyck_words(n):
     int
         The number of Dyck words of length 2n.
     """
-    return math.comb(2*n, n) // (n+1)
+    # Extend the list using C_{k+1} = C_k * 2(2k+1) / (k+2).
+    while len(_CATALAN) <= n:
+        k = len(_CATALAN) - 1
+        _CATALAN.append(_CATALAN[k] * 2 * (2 * k + 1) // (k + 2))
+    return _CATALAN[n]
+
+@lru_cache(maxsize=None)
+def _dyck_cum(n):
+    """
+    Computes the cumulative probabilities for the position k of the "Y" matching the first "X" of a random Dyck word of length 2n.
+    The probability of k is C_{k-1} * C_{n-k} / C_n, where C_i are the Catalan numbers.
+
+    Returns:
+    --------
+    tuple of float
+        The cumulative probabilities for k = 1, ..., n. The last entry is exactly 1.
+    """
+    weights = [number_dyck_words(i-1) * number_dyck_words(n-i) for i in range(1, n+1)]
+    total_weight = sum(weights)
 
-def random_dyck_word(n):
+    cum = []
+    acc = 0
+    for weight in weights:
+        acc += weight
+        cum.append(acc / total_weight)
+    return tuple(cum)
+
+def random_dyck_word(n, rng=None):
     """
     Generates a random Dyck word of length 2n.
 
     A Dyck word is a balanced string of X's and Y's such that in any prefix of the word, the number of X's is at least the number of Y's.
 
-    Runtime: Preprocesing O(n^2) to compute the product C_k * C_{n-k} for k = 1 to n
-    O(n) afterwards for recursion
+    Runtime: O(n), no preprocessing. A random arrangement of n X's and n+1 Y's is drawn,
+    for n < 32 (and no `rng` given) by shuffling a list in Python, otherwise by NumPy.
+    By the cycle lemma exactly one of its 2n+1 rotations has all proper prefixes with at least as many X's as Y's;
+    removing the final Y of this rotation gives a Dyck word, and every Dyck word arises from exactly 2n+1 arrangements.
     Parameters:
     -----------
     n : int
         The number of pairs of X's and Y's.
+    rng : numpy.random.Generator, optional
+        The generator to draw from, e.g. a seeded one for reproducible results. Defaults to a module-level generator.
 
     Returns:
     --------
     str
         A randomly generated Dyck word of length 2n.
-
-    TODO: Cache preprocessing
     """
-    if n == 0:
-        return ""
+    if rng is None:
+        if n < 32:
+            letters = ["X"] * n + ["Y"] * (n + 1)
+            _RNG_INST.shuffle(letters)
+
+            # The rotation starts right after the first position where the walk reaches its minimum.
+            height, lowest, start = 0, 1, 0
+            for i, letter in enumerate(letters):
+                height += 1 if letter == "X" else -1
+                if height < lowest:
+                    lowest, start = height, i + 1
+
+            # Rotate and drop the final "Y", which is letters[start - 1].
+            return "".join(letters[start:]) + "".join(letters[:start - 1])
+        rng = _RNG
+
+    # Random arrangement of n up-steps (X) and n+1 down-steps (Y).
+    steps = np.full(2 * n + 1, -1, dtype=np.int64)
+    steps[:n] = 1
+    rng.shuffle(steps)
+
+    # The rotation starts right after the first position where the walk reaches its minimum.
+    start = int(np.argmin(np.cumsum(steps))) + 1
+    word = np.roll(steps, -start)[:-1]
+
+    return np.where(word > 0, ord("X"), ord("Y")).astype(np.uint8).tobytes().decode("ascii")
+
+def random_dyck_word_recursive(n):
+    """
+    Generates a random Dyck word of length 2n by decomposing it as "X" + D(k-1) + "Y" + D(n-k).
+    Slower than `random_dyck_word`, kept for reference.
 
-    # Calculate the weights for the possible positions of the first "X" matching its "Y"
-    weights = [number_dyck_words(i-1) * number_dyck_words(n-i) for i in range(1, n+1)]
-    total_weight = sum(weights)
-    weights = [weight / total_weight for weight in weights]
+    A Dyck word is a balanced string of X's and Y's such that in any prefix of the word, the number of X's is at least the number of Y's.
 
-    # Randomly select the position k
-    k = sample(range(1, n+1), weights=weights)
+    Runtime: Preprocesing O(n^2) to compute the product C_k * C_{n-k} for k = 1 to n,
+    the cumulative probabilities are cached. O(n) afterwards, the decomposition
+    "X" + D(k-1) + "Y" + D(n-k) is expanded with an explicit stack instead of recursion
+    Parameters:
+    -----------
+    n : int
+        The number of pairs of X's and Y's.
 
-    return "X" + random_dyck_word(k-1) + "Y" + random_dyck_word(n-k)
+    Returns:
+    --------
+    str
+        A randomly generated Dyck word of length 2n.
+    """
+    out = []
+    # The stack holds the pending pieces of the word in reverse order:
+    # either a letter to emit or the size of a Dyck word still to be generated.
+    stack = [n]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+        elif item > 0:
+            # Randomly select the position k of the "Y" matching the first "X"
+            k = sample(range(1, item + 1), cum_weights=_dyck_cum(item))
+            out.append("X")
+            stack.append(item - k)
+            stack.append("Y")
+            stack.append(k - 1)
+
+    return "".join(out)
 
 class TreeNode:
     """
     A class representing a node in a binary tree.
 
+    The hash of a node is cached after it has been computed for the first time,
+    so the tree should not be modified after it has been hashed.
+
     Attributes:
     -----------
     value : any
@@ -339,10 +521,13 @@ class TreeNode:
     right : TreeNode, optional
         The right child of the node.
     """
+    __slots__ = ("value", "left", "right", "_hash")
+
     def __init__(self, value=0, left=None, right=None):
         self.value = value
         self.left = left
         self.right = right
+        self._hash = None
         
     def __repr__(self, level=0, prefix="Root: "):
         """
@@ -355,26 +540,122 @@ class TreeNode:
             ret += self.right.__repr__(level + 1, "R--- ")
         return ret
 
+    def __eq__(self, other):
+        """
+        Checks if two binary trees are structurally and value-wise equivalent.
+        The trees are compared iteratively, stopping at the first difference.
+        """
+        if not isinstance(other, TreeNode):
+            return False
+
+        stack = [(self, other)]
+        while stack:
+            a, b = stack.pop()
+            if a is b:
+                continue
+            if not isinstance(a, TreeNode) or not isinstance(b, TreeNode):
+                return False
+            if a._hash is not None and b._hash is not None and a._hash != b._hash:
+                return False
+            if a.value != b.value:
+                return False
+            stack.append((a.right, b.right))
+            stack.append((a.left, b.left))
+        return True
+
+    def __hash__(self):
+        """
+        Generates a hash value for the binary tree based on its structure and values.
+        The hashes of all nodes are computed bottom-up in an iterative post-order traversal and cached.
+        """
+        if self._hash is not None:
+            return self._hash
+
+        stack = [(self, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                # The children are hashed already, so hash() returns their cached values.
+                node._hash = hash((node.value, hash(node.left), hash(node.right)))
+                continue
+            stack.append((node, True))
+            for child in (node.left, node.right):
+                if isinstance(child, TreeNode) and child._hash is None:
+                    stack.append((child, False))
+        return self._hash
+
+class TreeArray:
+    """
+    A binary tree with `n` nodes stored as three parallel arrays instead of linked `TreeNode` objects.
+
+    The nodes are numbered in preorder, so node 0 is the root and two trees with the same
+    structure and values have identical arrays. Hashing and comparing a tree therefore only
+    compares three contiguous blocks of memory.
+
+    Attributes:
+    -----------
+    value : numpy.ndarray of int32
+        The character codes of the values stored in the nodes.
+    left : numpy.ndarray of int32
+        The index of the left child of each node, -1 if there is none.
+    right : numpy.ndarray of int32
+        The index of the right child of each node, -1 if there is none.
+    """
+    def __init__(self, n):
+        self.value = np.zeros(n, dtype=np.int32)
+        self.left = np.full(n, -1, dtype=np.int32)
+        self.right = np.full(n, -1, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.value)
+
+    def to_tree_node(self):
+        """
+        Converts the tree into linked `TreeNode` objects, e.g. for printing.
+
+        Returns:
+        --------
+        TreeNode or None
+            The root of the tree, or None if the tree is empty.
+        """
+        nodes = [TreeNode(chr(v)) for v in self.value.tolist()]
+        for node, left, right in zip(nodes, self.left.tolist(), self.right.tolist()):
+            if left >= 0:
+                node.left = nodes[left]
+            if right >= 0:
+                node.right = nodes[right]
+        return nodes[0] if nodes else None
+
+    def __repr__(self):
+        """
+        Generates a string representation of the binary tree for easy visualization.
+        """
+        return repr(self.to_tree_node())
+
     def __eq__(self, other):
         """
         Checks if two binary trees are structurally and value-wise equivalent.
         """
-        if isinstance(other, TreeNode):
-            return (self.value == other.value and
-                    self.left == other.left and
-                    self.right == other.right)
+        if isinstance(other, TreeArray):
+            return (np.array_equal(self.value, other.value) and
+                    np.array_equal(self.left, other.left) and
+                    np.array_equal(self.right, other.right))
         return False
 
     def __hash__(self):
         """
         Generates a hash value for the binary tree based on its structure and values.
         """
-        return hash((self.value, self.left, self.right))
+        return hash((self.value.tobytes(), self.left.tobytes(), self.right.tobytes()))
 
 def dyck_word_to_tree(word):
     """
     Converts a Dyck word into a binary tree.
 
+    The word is read once from left to right. Every "X" creates a node; the nodes
+    of the word between an "X" and its matching "Y" form its left subtree, the nodes
+    after the matching "Y" its right subtree. Runtime is O(n).
+
     Parameters:
     -----------
     word : str
@@ -382,31 +663,27 @@ def dyck_word_to_tree(word):
 
     Returns:
     --------
-    TreeNode
-        The root of the binary tree corresponding to the Dyck word.
+    TreeArray
+        The binary tree corresponding to the Dyck word. Use `to_tree_node()` to obtain linked `TreeNode` objects.
     """
-    if len(word) == 0:
-        return None 
-    
-    first, second = '', ''
-    balanced = 0 
-    
-    # Find the first balanced prefix
-    for i, char in enumerate(word):
+    tree = TreeArray(len(word) // 2)
+    tree.value[:] = ord("X")
+
+    stack = []  # Nodes whose "X" has not been matched by a "Y" yet.
+    parent, children = -1, None  # Where the next node is attached.
+    node = 0
+
+    for char in word:
         if char != "Y":
-            balanced += 1
+            if parent >= 0:
+                children[parent] = node
+            stack.append(node)
+            parent, children = node, tree.left
+            node += 1
         else:
-            balanced -= 1
-            if balanced == 0:
-                first = word[1:i]
-                second = word[i+1:]
-                break
-
-    root = TreeNode("X")
-    root.left = dyck_word_to_tree(first)
-    root.right = dyck_word_to_tree(second)
+            parent, children = stack.pop(), tree.right
 
-    return root
+    return tree
 
 def random_binary_tree(n):
     """
@@ -421,7 +698,7 @@ def random_binary_tree(n):
 
     Returns:
     --------
-    TreeNode
-        The root of the randomly generated binary tree.
+    TreeArray
+        The randomly generated binary tree.
     """
     return dyck_word_to_tree(random_dyck_word(n))
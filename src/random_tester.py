@@ -1,6 +1,122 @@
+from collections import Counter
+import inspect
+import multiprocessing as mp
+import pickle
+import numpy as np
+from random_variables import BATCH_SAMPLERS, NUMBA_KERNELS, _HAS_NUMBA, _NP_RNG, njit, set_seed
 
 
-def uniform_test(random_function, *args, N=10000, **kwargs):
+@njit(cache=True)
+def _fill_nb(kernel, out, args):
+    # Calls a Numba kernel len(out) times without returning to the interpreter.
+    for i in range(len(out)):
+        out[i] = kernel(*args)
+
+
+def _tally(random_function, args, kwargs, N, batch, dtype=None):
+    """
+    Runs a random function N times and counts how often each result occurs.
+
+    If `batch` is True, the NumPy-batched sibling of `random_function` (looked up in
+    `BATCH_SAMPLERS`; a batched sampler may also be passed directly) is called once
+    with `size=N` and the results are counted with `np.unique`. Raises a ValueError
+    if there is no batched sibling.
+
+    If `dtype` is an integer type, the samples are written into an array of that type and
+    counted with `np.bincount`; a TypeError is raised if a sample is not an integer and an
+    OverflowError if a sample does not fit into `dtype`. If Numba
+    is installed and `random_function` has a kernel in `NUMBA_KERNELS`, the array is filled
+    by calling the kernel in a compiled loop.
+
+    Otherwise the samples are collected in a list and counted with `collections.Counter`.
+
+    Returns:
+        dict: A dictionary mapping each result to its number of occurrences.
+    """
+    if batch:
+        if random_function in BATCH_SAMPLERS:
+            batch_function = BATCH_SAMPLERS[random_function]
+        elif random_function in BATCH_SAMPLERS.values():
+            batch_function = random_function
+        else:
+            name = getattr(random_function, "__name__", repr(random_function))
+            raise ValueError(f"batch=True is not supported for {name}: it has no batched sibling in BATCH_SAMPLERS")
+        samples = batch_function(*args, size=N, **kwargs)
+        keys, counts = np.unique(samples, return_counts=True)
+        return dict(zip(keys.tolist(), counts.tolist()))
+
+    if dtype is not None and np.issubdtype(dtype, np.integer):
+        if _HAS_NUMBA and random_function in NUMBA_KERNELS:
+            # The kernels take all arguments positionally, without defaults.
+            bound = inspect.signature(random_function).bind(*args, **kwargs)
+            bound.apply_defaults()
+            samples = np.empty(N, dtype=np.int64)
+            _fill_nb(NUMBA_KERNELS[random_function], samples, tuple(bound.args))
+        else:
+            samples = [random_function(*args, **kwargs) for _ in range(N)]
+            for x in samples:
+                if not isinstance(x, (int, np.integer)):
+                    name = getattr(random_function, "__name__", repr(random_function))
+                    raise TypeError(f"dtype={np.dtype(dtype)} requires integer samples, but {name} returned {x!r}")
+            samples = np.array(samples, dtype=np.int64)
+        if N == 0:
+            return {}
+        # Check the range before casting, a plain cast would wrap around silently.
+        info = np.iinfo(dtype)
+        low, high = int(samples.min()), int(samples.max())
+        if low < info.min or high > info.max:
+            raise OverflowError(f"samples in the range [{low}, {high}] do not fit into dtype={np.dtype(dtype)}")
+        samples = samples.astype(dtype)
+        # Shift the samples so that np.bincount also handles negative values.
+        offset = int(samples.min())
+        counts = np.bincount(samples - offset)
+        keys = np.flatnonzero(counts)
+        return dict(zip((keys + offset).tolist(), counts[keys].tolist()))
+
+    # Run the random function N times and store the results
+    samples = [random_function(*args, **kwargs) for _ in range(N)]
+
+    return Counter(samples)
+
+def _tally_worker(task):
+    """
+    Runs `_tally` in a worker process after seeding the process with its own seed.
+    """
+    random_function, args, kwargs, N, batch, dtype, seed = task
+    # A forked worker inherits the state of the generators, reseed to get independent samples.
+    set_seed(seed)
+    return Counter(_tally(random_function, args, kwargs, N, batch, dtype))
+
+def _parallel_tally(random_function, args, kwargs, N, batch, dtype, n_workers):
+    """
+    Splits the N runs of `_tally` across `n_workers` processes and merges the counts.
+
+    Falls back to a single process if the random function or its arguments can not be pickled, or if
+    the worker processes could not import the random function: with the start methods "spawn" and
+    "forkserver" (the default on macOS and Windows) the workers can not see functions defined in
+    `__main__`, e.g. in a notebook, and would fail inside the pool.
+
+    Returns:
+        dict: A dictionary mapping each result to its number of occurrences.
+    """
+    try:
+        pickle.dumps((random_function, args, kwargs))
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return _tally(random_function, args, kwargs, N, batch, dtype)
+    if mp.get_start_method() != "fork" and getattr(random_function, "__module__", None) == "__main__":
+        return _tally(random_function, args, kwargs, N, batch, dtype)
+
+    # Derive the seeds from the package generator, so that `set_seed` makes the result reproducible.
+    seeds = _NP_RNG.integers(2**32, size=n_workers).tolist()
+    tasks = [(random_function, args, kwargs, N // n_workers + (i < N % n_workers), batch, dtype, seed)
+             for i, seed in enumerate(seeds)]
+    with mp.Pool(n_workers) as pool:
+        parts = pool.map(_tally_worker, tasks)
+    return sum(parts, Counter())
+
+
+
+def uniform_test(random_function, *args, N=10000, batch=False, dtype=None, n_workers=1, **kwargs):
     """
     Tests the uniformity of a random function.
 
@@ -8,6 +124,12 @@ def uniform_test(random_function, *args, N=10000, **kwargs):
         random_function (function): The random function to be tested.
         *args: Variable number of arguments to be passed to the random function.
         N (int, optional): The number of times the random function is run. Defaults to 10000.
+        batch (bool, optional): If True, draw all N samples with a single call to the NumPy-batched
+            sibling of the random function (see `BATCH_SAMPLERS`). Defaults to False.
+        dtype (numpy dtype, optional): If an integer type such as `np.int64`, the results are stored
+            in an array of this type and counted with `np.bincount`. Defaults to None.
+        n_workers (int, optional): The number of processes the N runs are split across. Only worth it
+            for expensive random functions such as `random_binary_tree`. Defaults to 1.
         **kwargs: Variable number of keyword arguments to be passed to the random function.
 
     Returns:
@@ -43,17 +165,10 @@ def uniform_test(random_function, *args, N=10000, **kwargs):
         Theoretical Probability: x.xxxx
         Total Sum: x.xxxx
     """
-    results = {}
-    
-    # Run the random function N times and store the results
-    for _ in range(N):
-        random_object = random_function(*args,**kwargs)
-        
-        # Update the count for each unique random object
-        if random_object not in results:
-            results[random_object] = 1
-        else:
-            results[random_object] += 1
+    if n_workers > 1:
+        results = _parallel_tally(random_function, args, kwargs, N, batch, dtype, n_workers)
+    else:
+        results = _tally(random_function, args, kwargs, N, batch, dtype)
 
     # Print header
     print(f"{'Random Object':<30} | {'Probability':<12} | {'Discrepancy':<10}")
@@ -86,7 +201,7 @@ def uniform_test(random_function, *args, N=10000, **kwargs):
 
 
 
-def random_test(random_function, *args, N=10000, **kwargs):
+def random_test(random_function, *args, N=10000, batch=False, dtype=None, n_workers=1, **kwargs):
     """
     This function tests a given random function by running it N times, storing the results and printing the probabilities.
     
@@ -94,6 +209,9 @@ def random_test(random_function, *args, N=10000, **kwargs):
     random_function (function): The random function to be tested.
     *args: Variable number of arguments to be passed to the random function.
     N (int): The number of times the random function is run. Defaults to 10000.
+    batch (bool): If True, draw all N samples with a single call to the NumPy-batched sibling of the random function. Defaults to False.
+    dtype (numpy dtype): If an integer type such as `np.int64`, the results are stored in an array of this type and counted with `np.bincount`. Defaults to None.
+    n_workers (int): The number of processes the N runs are split across. Defaults to 1.
     **kwargs: Variable number of keyword arguments to be passed to the random function.
     
     Returns:
@@ -103,15 +221,11 @@ def random_test(random_function, *args, N=10000, **kwargs):
     - This function assumes that the random function returns a unique value each time it is called.
     - The return value of random_function needs to be hashable.
     """
-    results = {}
+    if n_workers > 1:
+        results = _parallel_tally(random_function, args, kwargs, N, batch, dtype, n_workers)
+    else:
+        results = _tally(random_function, args, kwargs, N, batch, dtype)
     total_probability = 0
-    
-    # Run the random function N times and store the results
-    for _ in range(N):
-        random_object = random_function(*args, **kwargs)
-        
-        # Update the count for each unique random object
-        results[random_object] = results.get(random_object, 0) + 1
 
     # Print header
     print(f"{'Random Object':<30} | {'Probability':<12}")
@@ -4,8 +4,134 @@ import math
 
 import random
 import math
+from functools import lru_cache
+import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        Fallback for `numba.njit` if Numba is not installed: the function is left uncompiled.
+        Supports both the bare form `@njit` and the called form `@njit(...)`.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+# Random number generator of the package, reseeded by `set_seed`. Its methods are bound
+# once to save the attribute lookup in the hot sampling paths.
+_RNG_INST = random.Random()
+_rand = _RNG_INST.random
+_getrandbits = _RNG_INST.getrandbits
+
+# NumPy generator used by the batched samplers below.
+_NP_RNG = np.random.default_rng()
+
+
+def _ziggurat_tables(layers: int = 128):
+    """
+    Computes the tables for the Ziggurat method of Marsaglia and Tsang for the normal distribution.
+
+    Returns:
+    tuple: The tuples (K, W, F) of length `layers`. K contains the integer acceptance thresholds,
+    W the scaling factors from 32-bit integers to floats and F the values of the density exp(-x^2/2)
+    at the layer boundaries.
+    """
+    m1 = 2147483648.0
+    dn = 3.442619855899
+    tn = dn
+    vn = 9.91256303526217e-3
+
+    k = [0] * layers
+    w = [0.0] * layers
+    f = [0.0] * layers
+
+    q = vn / math.exp(-0.5 * dn * dn)
+    k[0] = int((dn / q) * m1)
+    k[1] = 0
+    w[0] = q / m1
+    w[layers - 1] = dn / m1
+    f[0] = 1.0
+    f[layers - 1] = math.exp(-0.5 * dn * dn)
+
+    for i in range(layers - 2, 0, -1):
+        dn = math.sqrt(-2 * math.log(vn / dn + math.exp(-0.5 * dn * dn)))
+        k[i + 1] = int((dn / tn) * m1)
+        tn = dn
+        f[i] = math.exp(-0.5 * dn * dn)
+        w[i] = dn / m1
+
+    return tuple(k), tuple(w), tuple(f)
+
+ZIG_K, ZIG_W, ZIG_F = _ziggurat_tables()
+# Start of the tail of the normal distribution, i.e. the right edge of the base layer.
+ZIG_R = 3.442619855899
+
+
+# Numba kernels for the samplers which loop over many uniform random numbers.
+# They use NumPy's random number generator, which Numba compiles inline.
+
+@njit(cache=True)
+def _binomial_nb(n, p):
+    successes = 0
+    for _ in range(n):
+        if np.random.random() < p:
+            successes += 1
+    return successes
+
+@njit(cache=True)
+def _chi_square_nb(k):
+    total = 0.0
+    for _ in range(k):
+        r = math.sqrt(-2 * math.log(1.0 - np.random.random()))
+        x = r * math.cos(2 * math.pi * np.random.random())
+        total += x * x
+    return total
+
+@njit(cache=True)
+def _poisson_nb(exp_lambda):
+    T = -math.log(1.0 - np.random.random()) / exp_lambda
+    counter = 0
+    while T < 1:
+        T += -math.log(1.0 - np.random.random()) / exp_lambda
+        counter += 1
+    return counter
+
+@njit(cache=True)
+def _seed_nb(seed):
+    # Numba keeps its own random state, which can only be seeded from compiled code.
+    np.random.seed(seed)
+
+if _HAS_NUMBA:
+    # Compile the kernels now rather than on the first call. If compilation fails, fall back to pure Python.
+    try:
+        _binomial_nb(1, 0.5)
+        _chi_square_nb(1)
+        _poisson_nb(1.0)
+    except Exception:
+        _HAS_NUMBA = False
+
+def set_seed(seed: int) -> None:
+    """
+    Seeds the random number generators used by the package, making the results reproducible. Runtime is O(1).
+
+    This covers the Python generator behind the scalar samplers, the NumPy generator behind the batched
+    samplers and the combinatorial algorithms, and the generator of the Numba kernels if Numba is installed.
+
+    Parameters:
+    seed (int): The seed, a non-negative integer.
+    """
+    _RNG_INST.seed(seed)
+    # Reseed in place, so that modules holding a reference to the generator are reseeded as well.
+    _NP_RNG.bit_generator.state = np.random.default_rng(seed).bit_generator.state
+    if _HAS_NUMBA:
+        _seed_nb(seed % 2**32)
+
 def uniform(a: float = 0, b: float = 1) -> float:
     """
     Generates a random number uniformly distributed between a and b. Runtime is O(1).
@@ -17,7 +143,7 @@ def uniform(a: float = 0, b: float = 1) -> float:
     Returns:
     float: A random number between a and b.
     """
-    return a + random.random() * (b - a)
+    return a + _rand() * (b - a)
 
 def uniform_int(a: int, b: int) -> int:
     """
@@ -30,11 +156,15 @@ def uniform_int(a: int, b: int) -> int:
     Returns:
     int: A random integer between a and b (inclusive).
     """
-    return math.floor(uniform(a, b + 1))
+    return math.floor(a + _rand() * (b - a + 1))
 
 def normal(mu: float, sigma: float) -> float:
     """
-    Calculates a random number following a normal distribution. Runtime is O(1).
+    Calculates a random number following a normal distribution. Runtime is O(1) (expected).
+
+    Uses the Ziggurat method with 128 layers: in about 99% of the calls a single 32-bit random
+    integer, one table lookup and one comparison suffice. Only on the wedges and the tail
+    the density has to be evaluated.
 
     Parameters:
     mu (float): The mean of the normal distribution.
@@ -43,10 +173,30 @@ def normal(mu: float, sigma: float) -> float:
     Returns:
     float: A random number drawn from the normal distribution with mean mu and standard deviation sigma.
     """
-    r = math.sqrt(-2 * math.log(uniform()))
-    x = r * math.cos(2 * math.pi * uniform())
-
-    return mu + sigma * x
+    while True:
+        j = _getrandbits(32)
+        i = j & 127
+        # Interpret the random bits as a signed 32-bit integer.
+        if j >= 2147483648:
+            j -= 4294967296
+
+        x = j * ZIG_W[i]
+        if abs(j) < ZIG_K[i]:
+            return mu + sigma * x
+
+        if i == 0:
+            # Sample from the tail beyond ZIG_R using Marsaglia's rejection method.
+            while True:
+                x = -math.log(_rand()) / ZIG_R
+                y = -math.log(_rand())
+                if y + y >= x * x:
+                    break
+            x = ZIG_R + x if j > 0 else -ZIG_R - x
+            return mu + sigma * x
+
+        # Sample from the wedge of layer i.
+        if ZIG_F[i] + _rand() * (ZIG_F[i - 1] - ZIG_F[i]) < math.exp(-0.5 * x * x):
+            return mu + sigma * x
 
 def exponential(exp_lambda: float) -> float:
     """
@@ -59,12 +209,12 @@ def exponential(exp_lambda: float) -> float:
     Returns:
     float: A random number drawn from the exponential distribution with rate exp_lambda.
     """
-    return -1 / exp_lambda * math.log(uniform())
+    return -1 / exp_lambda * math.log(_rand())
 
 def poisson(exp_lambda: float) -> int:
     """
     Generates a random number following a Poisson distribution.
-    Expected runtime is O(exp_lambda).
+    Expected runtime is O(exp_lambda). Uses a Numba kernel if Numba is installed.
 
     Parameters:
     exp_lambda (float): The rate parameter of the Poisson distribution.
@@ -72,7 +222,10 @@ def poisson(exp_lambda: float) -> int:
     Returns:
     int: A random number drawn from the Poisson distribution with rate exp_lambda.
     """
-    T = 0
+    if _HAS_NUMBA:
+        return _poisson_nb(exp_lambda)
+
+    T = exponential(exp_lambda)
     counter = 0
     while T < 1:
         T += exponential(exp_lambda)
@@ -90,11 +243,12 @@ def bernoulli(p: float) -> bool:
     Returns:
     bool: A boolean value representing the Bernoulli random variable.
     """
-    return uniform_int(0, 1) < p
+    return _rand() < p
 
 def binomial(n: int, p: float = 0.5) -> int:
     """
     Generates a random number following a binomial distribution. Runtime is O(n).
+    For n >= 32 a Numba kernel is used if Numba is installed.
 
     Parameters:
     n (int): The number of trials in the binomial distribution.
@@ -103,8 +257,18 @@ def binomial(n: int, p: float = 0.5) -> int:
     Returns:
     int: A random number drawn from the binomial distribution with n trials and probability p.
     """
+    if _HAS_NUMBA and n >= 32:
+        return _binomial_nb(n, p)
+
     return sum(bernoulli(p) for _ in range(n))
 
+@lru_cache(maxsize=1024)
+def _log_1mp(p: float) -> float:
+    """
+    Computes log(1 - p), accurate also for small p. Cached since geometric() is usually called repeatedly with the same p.
+    """
+    return math.log1p(-p)
+
 def geometric(p: float) -> int:
     """
     Generates a random number following a geometric distribution. Runtime is O(1).
@@ -115,12 +279,14 @@ def geometric(p: float) -> int:
     Returns:
     int: A random number drawn from the geometric distribution with success probability p.
     """
-    exp_lambda = -math.log(1 - p)
-    return math.floor(exponential(exp_lambda))
+    # Inverse sampling: floor of an exponential random variable with rate -log(1 - p).
+    return math.floor(math.log(_rand()) / _log_1mp(p))
 
 def chi_square(k: int) -> float:
     """
     Calculates the value of the chi-squared distribution. Runetime is O(k).
+    Uses a Numba kernel if Numba is installed. Otherwise, for k >= 8 the k standard normal
+    random variables are drawn and summed by NumPy.
 
     Parameters:
     k (int): The number of degrees of freedom.
@@ -128,12 +294,33 @@ def chi_square(k: int) -> float:
     Returns:
     float: The value of the chi-squared distribution.
     """
+    if _HAS_NUMBA:
+        return _chi_square_nb(k)
+    if k >= 8:
+        return float((_NP_RNG.standard_normal(k) ** 2).sum())
 
     return sum(normal(0, 1) ** 2 for _ in range(k))
 
+def _polar_unit() -> tuple[float, float, float]:
+    """
+    Generates a random point (x, y) uniformly distributed inside the unit disk by rejection sampling
+    from the square [-1, 1]^2 (Marsaglia's polar method). Expected runtime is O(1), a point is
+    accepted with probability pi/4.
+
+    Returns:
+    tuple: The coordinates x and y and the squared norm s = x^2 + y^2, with 0 < s <= 1.
+    """
+    while True:
+        x = 2 * _rand() - 1
+        y = 2 * _rand() - 1
+        s = x * x + y * y
+        if 0 < s <= 1:
+            return x, y, s
+
 def uniform_disk(r: float) -> list[float]:
     """
-    Generates a random point uniformly distributed inside a disk. Runtime is O(1).
+    Generates a random point uniformly distributed inside a disk. Runtime is O(1) (expected).
+    Uses rejection sampling, so no trigonometric functions are needed.
 
     Parameters:
     r (float): The radius of the disk.
@@ -141,16 +328,13 @@ def uniform_disk(r: float) -> list[float]:
     Returns:
     List[float]: A list containing the x and y coordinates of the generated point.
     """
-
-    u = uniform(0, 1)
-    phi = 2 * math.pi * uniform(0, 1)
-    x = r * math.sqrt(u) * math.cos(phi)
-    y = r * math.sqrt(u) * math.sin(phi)
-    return [x, y]
+    x, y, _ = _polar_unit()
+    return [r * x, r * y]
 
 def uniform_circle(r: float) -> list[float]:
     """
-    Generates a random point on a circle of radius r. Runtime is O(1).
+    Generates a random point on a circle of radius r. Runtime is O(1) (expected).
+    A uniform point in the unit disk is projected onto the circle, which needs one square root instead of cos and sin.
 
     Parameters:
     r (float): The radius of the circle.
@@ -158,11 +342,149 @@ def uniform_circle(r: float) -> list[float]:
     Returns:
     list: A list containing the x and y coordinates of the random point on the circle.
     """
+    x, y, s = _polar_unit()
+    d = r / math.sqrt(s)
+    return [x * d, y * d]
+
+def uniform_batch(a: float = 0, b: float = 1, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers uniformly distributed between a and b. Runtime is O(size).
+
+    Parameters:
+    a (float): The lower bound of the range (inclusive). Defaults to 0.
+    b (float): The upper bound of the range (exclusive). Defaults to 1.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers between a and b.
+    """
+    return _NP_RNG.uniform(a, b, size)
 
-    phi = 2 * math.pi * uniform(0, 1)
-    u = math.sqrt(-2*math.log(uniform(0, 1)))
-    x = r *  math.cos(phi)
-    y = r * math.sin(phi)
-    d = math.sqrt(x**2 + y**2)
-    return r* [x/d, y/d]
+def uniform_int_batch(a: int, b: int, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random integers uniformly distributed between a and b (inclusive). Runtime is O(size).
+
+    Parameters:
+    a (int): The lower bound of the range (inclusive).
+    b (int): The upper bound of the range (inclusive).
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random integers between a and b (inclusive).
+    """
+    return _NP_RNG.integers(a, b, size, endpoint=True)
+
+def normal_batch(mu: float, sigma: float, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers following a normal distribution. Runtime is O(size).
+
+    Parameters:
+    mu (float): The mean of the normal distribution.
+    sigma (float): The standard deviation of the normal distribution.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers drawn from the normal distribution.
+    """
+    return _NP_RNG.normal(mu, sigma, size)
+
+def exponential_batch(exp_lambda: float, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers following an exponential distribution. Runtime is O(size).
+
+    Parameters:
+    exp_lambda (float): The rate parameter of the exponential distribution.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers drawn from the exponential distribution with rate exp_lambda.
+    """
+    return _NP_RNG.exponential(1 / exp_lambda, size)
+
+def poisson_batch(exp_lambda: float, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers following a Poisson distribution. Runtime is O(size).
+
+    Parameters:
+    exp_lambda (float): The rate parameter of the Poisson distribution.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers drawn from the Poisson distribution with rate exp_lambda.
+    """
+    return _NP_RNG.poisson(exp_lambda, size)
+
+def bernoulli_batch(p: float, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` Bernoulli random variables. Runtime is O(size).
+
+    Parameters:
+    p (float): The probability of the Bernoulli variable being True.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: A boolean array of Bernoulli random variables.
+    """
+    return _NP_RNG.random(size) < p
+
+def binomial_batch(n: int, p: float = 0.5, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers following a binomial distribution. Runtime is O(size).
+
+    Parameters:
+    n (int): The number of trials in the binomial distribution.
+    p (float, optional): The probability of success in each trial. Defaults to 0.5.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers drawn from the binomial distribution with n trials and probability p.
+    """
+    return _NP_RNG.binomial(n, p, size)
+
+def geometric_batch(p: float, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers following a geometric distribution. Runtime is O(size).
+
+    As for `geometric`, the result counts the failures before the first success and starts at 0.
+
+    Parameters:
+    p (float): The probability of success in a single trial.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers drawn from the geometric distribution with success probability p.
+    """
+    return _NP_RNG.geometric(p, size) - 1
+
+def chi_square_batch(k: int, size: int = 1) -> np.ndarray:
+    """
+    Generates `size` random numbers following a chi-squared distribution. Runtime is O(size).
+
+    Parameters:
+    k (int): The number of degrees of freedom.
+    size (int): The number of samples. Defaults to 1.
+
+    Returns:
+    np.ndarray: An array of random numbers drawn from the chi-squared distribution.
+    """
+    return _NP_RNG.chisquare(k, size)
+
+# Maps each scalar sampler to its NumPy-batched sibling, used by the testers in `random_tester.py`.
+BATCH_SAMPLERS = {
+    uniform: uniform_batch,
+    uniform_int: uniform_int_batch,
+    normal: normal_batch,
+    exponential: exponential_batch,
+    poisson: poisson_batch,
+    bernoulli: bernoulli_batch,
+    binomial: binomial_batch,
+    geometric: geometric_batch,
+    chi_square: chi_square_batch,
+}
+
+# Maps the integer-valued samplers to their Numba kernels, used by the testers to draw samples in a compiled loop.
+NUMBA_KERNELS = {
+    binomial: _binomial_nb,
+    poisson: _poisson_nb,
+}
 